@@ -69,7 +69,7 @@ def get_temporary_credentials(
                 role_arn,
             )
             raise DownstreamError() from Exception(
-                "Could not assume specified role '{role_arn}'"
+                f"Could not assume specified role '{role_arn}'"
             )
         temp = response["Credentials"]
         creds = (temp["AccessKeyId"], temp["SecretAccessKey"], temp["SessionToken"])
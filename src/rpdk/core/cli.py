@@ -2,34 +2,70 @@
 """
 import argparse
 import logging
+import os
 import sys
 import time
+from copy import deepcopy
+from importlib import import_module
 from logging.config import dictConfig
 
 from colorama import colorama_text
 
 from .__init__ import __version__
-from .build_image import setup_subparser as build_image_setup_subparser
 from .data_loaders import resource_yaml
 from .exceptions import DownstreamError, SysExitRecommendedError
 from .extensions import setup_subparsers as extensions_setup_subparser
-from .generate import setup_subparser as generate_setup_subparser
-from .init import setup_subparser as init_setup_subparser
-from .invoke import setup_subparser as invoke_setup_subparser
-from .package import setup_subparser as package_setup_subparser
-from .submit import setup_subparser as submit_setup_subparser
-from .test import setup_subparser as test_setup_subparser
-from .validate import setup_subparser as validate_setup_subparser
 
 EXIT_UNHANDLED_EXCEPTION = 127
 
+# sub command name -> module providing setup_subparser. these modules pull in
+# heavy dependencies, so only the one for the selected command is imported
+SUBCOMMAND_MODULES = {
+    "init": "init",
+    "validate": "validate",
+    "submit": "submit",
+    "generate": "generate",
+    "test": "test",
+    "invoke": "invoke",
+    "build-image": "build_image",
+    "package": "package",
+}
+
+LOGGING_CONFIG = resource_yaml(__name__, "data/logging.yaml")
+
 
 class UTCFormatter(logging.Formatter):
     converter = time.gmtime
 
 
+class StdoutHandler(logging.StreamHandler):
+    """A stream handler that always writes to the current ``sys.stdout``,
+    even if it was replaced after logging was configured.
+    """
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, _value):
+        pass
+
+
+def _handlers_by_name():
+    return {handler.name: handler for handler in logging.getLogger().handlers}
+
+
 def setup_logging(verbosity):
-    """Configure logging with a variable verbosity level (0, 1, 2)."""
+    """Configure logging with a variable verbosity level (0, 1, 2).
+
+    The logging configuration is only applied again if the log file would
+    change (i.e. the working directory is different). Otherwise, only the
+    level of the console handler is adjusted.
+    """
     if verbosity > 1:
         level = logging.DEBUG
     elif verbosity > 0:
@@ -37,11 +73,44 @@ def setup_logging(verbosity):
     else:
         level = logging.WARNING
 
-    logging_config = resource_yaml(__name__, "data/logging.yaml")
+    handlers = _handlers_by_name()
+    console = handlers.get("console")
+    logfile = handlers.get("logfile")
+    log_path = os.path.abspath(LOGGING_CONFIG["handlers"]["logfile"]["filename"])
+    if (
+        isinstance(console, StdoutHandler)
+        and logfile is not None
+        and logfile.baseFilename == log_path
+    ):
+        console.setLevel(level)
+        return
+
+    # dictConfig consumes parts of the configuration, so don't hand it ours
+    logging_config = deepcopy(LOGGING_CONFIG)
     logging_config["handlers"]["console"]["level"] = level
     dictConfig(logging_config)
 
 
+def selected_subcommand(args_in):
+    """Return the sub command name in the arguments, if any.
+
+    The top-level parser only has flags, so the sub command is simply the first
+    positional argument.
+    """
+    args = sys.argv[1:] if args_in is None else args_in
+    return next((arg for arg in args if not arg.startswith("-")), None)
+
+
+def setup_subcommand_subparsers(subparsers, parents, selected):
+    for command_name, module_name in SUBCOMMAND_MODULES.items():
+        if command_name == selected:
+            module = import_module(f".{module_name}", __package__)
+            module.setup_subparser(subparsers, parents)
+        else:
+            # placeholder, so the command is still listed and accepted
+            subparsers.add_parser(command_name, parents=parents)
+
+
 def unittest_patch_setup_subparser(_subparsers, _parents):
     pass
 
@@ -82,15 +151,8 @@ def main(args_in=None):  # pylint: disable=too-many-statements
         parents = [base_subparser]
 
         subparsers = parser.add_subparsers(dest="subparser_name")
-        init_setup_subparser(subparsers, parents)
-        validate_setup_subparser(subparsers, parents)
-        submit_setup_subparser(subparsers, parents)
-        generate_setup_subparser(subparsers, parents)
-        test_setup_subparser(subparsers, parents)
-        invoke_setup_subparser(subparsers, parents)
+        setup_subcommand_subparsers(subparsers, parents, selected_subcommand(args_in))
         unittest_patch_setup_subparser(subparsers, parents)
-        build_image_setup_subparser(subparsers, parents)
-        package_setup_subparser(subparsers, parents)
         extensions_setup_subparser(subparsers, parents)
 
         args = parser.parse_args(args=args_in)
@@ -12,7 +12,6 @@ from uuid import uuid4
 import docker
 from botocore import UNSIGNED
 from botocore.config import Config
-from jinja2 import Environment, PackageLoader, select_autoescape
 
 from rpdk.core.boto_helpers import (
     LOWER_CAMEL_CRED_KEYS,
@@ -135,14 +134,6 @@ class HookClient:  # pylint: disable=too-many-instance-attributes
 
     def _update_schema(self, schema):
         # TODO: resolve $ref
-        self.env = Environment(
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-            # Unable to use __name__ anymore after Jinja2 3.x change
-            loader=PackageLoader("rpdk.core", "templates/"),
-            autoescape=select_autoescape(["html", "htm", "xml", "md"]),
-        )
         self._schema = schema
         self._configuration_schema = schema.get("typeConfiguration")
 
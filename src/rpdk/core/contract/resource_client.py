@@ -209,6 +209,7 @@ class ResourceClient:  # pylint: disable=too-many-instance-attributes
             self._client = self._session.client("lambda", endpoint_url=endpoint)
 
         self._schema = None
+        self._schema_json = None
         self._strategy = None
         self._update_strategy = None
         self._invalid_strategy = None
@@ -227,6 +228,7 @@ class ResourceClient:  # pylint: disable=too-many-instance-attributes
     def _update_schema(self, schema):
         # TODO: resolve $ref
         self._schema = schema
+        self._schema_json = None
         self._strategy = None
         self._update_strategy = None
         self._invalid_strategy = None
@@ -312,6 +314,13 @@ class ResourceClient:  # pylint: disable=too-many-instance-attributes
             and properties[prop]["insertionOrder"] == "false"
         }
 
+    def _copy_schema(self):
+        # make a copy so the original schema is never modified. the schema is
+        # only serialized once, and each strategy gets its own copy from that
+        if self._schema_json is None:
+            self._schema_json = json.dumps(self._schema)
+        return json.loads(self._schema_json)
+
     @property
     def strategy(self):
         # an empty strategy (i.e. false-y) is valid
@@ -321,8 +330,7 @@ class ResourceClient:  # pylint: disable=too-many-instance-attributes
         # imported here to avoid hypothesis being loaded before pytest is loaded
         from .resource_generator import ResourceGenerator
 
-        # make a copy so the original schema is never modified
-        schema = json.loads(json.dumps(self._schema))
+        schema = self._copy_schema()
 
         prune_properties(schema, self.read_only_paths)
 
@@ -338,8 +346,7 @@ class ResourceClient:  # pylint: disable=too-many-instance-attributes
         # imported here to avoid hypothesis being loaded before pytest is loaded
         from .resource_generator import ResourceGenerator
 
-        # make a copy so the original schema is never modified
-        schema = json.loads(json.dumps(self._schema))
+        schema = self._copy_schema()
 
         self._invalid_strategy = ResourceGenerator(schema).generate_schema_strategy(
             schema
@@ -355,8 +362,7 @@ class ResourceClient:  # pylint: disable=too-many-instance-attributes
         # imported here to avoid hypothesis being loaded before pytest is loaded
         from .resource_generator import ResourceGenerator
 
-        # make a copy so the original schema is never modified
-        schema = json.loads(json.dumps(self._schema))
+        schema = self._copy_schema()
 
         prune_properties(schema, self.read_only_paths)
         prune_properties(schema, self.create_only_paths)
@@ -369,6 +375,9 @@ class ResourceClient:  # pylint: disable=too-many-instance-attributes
     def generate_create_example(self):
         if self._inputs:
             return self._inputs["CREATE"]
+        # the strategy is only built once, but a fresh example is drawn on each
+        # call on purpose: contract tests that create their own resource must
+        # not reuse writable identifiers of another test's resource
         example = self.strategy.example()
         return override_properties(example, self._overrides.get("CREATE", {}))
 
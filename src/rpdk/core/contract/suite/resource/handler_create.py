@@ -25,6 +25,9 @@ from rpdk.core.contract.suite.resource.handler_commons import (
 LOG = logging.getLogger(__name__)
 
 
+# module scope is intentional: resource_client is module scoped, and when
+# inputs files are used every handler module creates its resource from the
+# same model, so it must be deleted before the next module creates its own
 @pytest.fixture(scope="module")
 def created_resource(resource_client):
     request = input_model = model = resource_client.generate_create_example()
@@ -34,6 +37,18 @@ def created_resource(resource_client):
         )
         model = response["resourceModel"]
         test_input_equals_output(resource_client, input_model, model)
+    except BaseException:  # pylint: disable=broad-except
+        # the handler may have provisioned the resource even though an assertion
+        # failed, so still try to delete it. a failing delete is only logged,
+        # so the original error is the one reported
+        try:
+            resource_client.call_and_assert(
+                Action.DELETE, OperationStatus.SUCCESS, model
+            )
+        except Exception:  # pylint: disable=broad-except
+            LOG.exception("Cleanup delete after failed create also failed")
+        raise
+    try:
         yield input_model, model, request
     finally:
         resource_client.call_and_assert(Action.DELETE, OperationStatus.SUCCESS, model)
@@ -3,6 +3,7 @@ import logging
 import os
 import re
 import shutil
+from functools import lru_cache
 from io import TextIOWrapper
 from pathlib import Path
 
@@ -50,14 +51,24 @@ def resource_yaml(package_name, resource_name):
 
 
 def copy_resource(package_name, resource_name, out_path):
+    """Copy a package resource to out_path.
+
+    Not used by the CLI itself, but kept for plugins that copy their bundled
+    files into a project.
+    """
     with pkg_resources.resource_stream(
         package_name, resource_name
     ) as fsrc, out_path.open("wb") as fdst:
         shutil.copyfileobj(fsrc, fdst)
 
 
+@lru_cache(maxsize=None)
 def get_schema_store(schema_search_path):
-    """Load all the schemas in schema_search_path and return a dict"""
+    """Load all the schemas in schema_search_path and return a dict
+
+    The result is cached, since every validator created by make_validator
+    needs the same store. It must not be modified.
+    """
     schema_store = {}
     schema_fnames = os.listdir(schema_search_path)
     for schema_fname in schema_fnames:
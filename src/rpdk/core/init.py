@@ -4,7 +4,7 @@ or schema files for a module.
 import argparse
 import logging
 import re
-from functools import wraps
+from functools import cached_property, lru_cache, wraps
 
 from colorama import Fore, Style
 
@@ -20,6 +20,7 @@ LOG = logging.getLogger(__name__)
 
 
 TYPE_NAME_REGEX = r"^[a-zA-Z0-9]{2,64}::[a-zA-Z0-9]{2,64}::[a-zA-Z0-9]{2,64}$"
+TYPE_NAME_PATTERN = re.compile(TYPE_NAME_REGEX)
 
 
 def print_error(error):
@@ -46,7 +47,7 @@ def input_with_validation(prompt, validate, description=""):
 
 
 def validate_type_name(value):
-    match = re.match(TYPE_NAME_REGEX, value)
+    match = TYPE_NAME_PATTERN.match(value)
     if match:
         return value
     LOG.debug("'%s' did not match '%s'", value, TYPE_NAME_REGEX)
@@ -60,10 +61,13 @@ class ValidatePluginChoice:
         self.choices = tuple(choices)
         self.max = len(self.choices)
 
+    @cached_property
+    def message(self):
+        # only needed when prompting, i.e. not if a language was passed in
         pretty = "\n".join(
             f"[{i}] {choice}" for i, choice in enumerate(self.choices, 1)
         )
-        self.message = (
+        return (
             "Select a language for code generation:\n"
             + pretty
             + "\n(enter an integer): "
@@ -81,9 +85,10 @@ class ValidatePluginChoice:
         return self.choices[choice]
 
 
-validate_plugin_choice = ValidatePluginChoice(  # pylint: disable=invalid-name
-    get_plugin_choices()
-)
+@lru_cache(maxsize=1)
+def get_validate_plugin_choice():
+    # scanning the plugin entry points is slow, so only do it when prompting
+    return ValidatePluginChoice(get_plugin_choices())
 
 
 def check_for_existing_project(project):
@@ -112,6 +117,7 @@ def check_for_existing_project(project):
 
 def input_language():
     # language/plugin
+    validate_plugin_choice = get_validate_plugin_choice()
     if validate_plugin_choice.max < 1:
         LOG.critical("No language plugins found")
         raise WizardAbortError()
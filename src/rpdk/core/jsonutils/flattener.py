@@ -28,6 +28,9 @@ class JsonSchemaFlattener:
     def __init__(self, schema):
         self._schema_map = {}
         self._full_schema = schema
+        # ref path -> traverse() result, since the same ref is usually used
+        # in several places
+        self._ref_index = {}
 
     def flatten_schema(self):
         self._walk(self._full_schema, ())
@@ -180,7 +183,13 @@ class JsonSchemaFlattener:
         :return: the subschema corresponding to the ref
         """
         try:
-            return traverse(self._full_schema, ref_path)
+            return self._ref_index[ref_path]
+        except KeyError:
+            pass
+        try:
+            found = traverse(self._full_schema, ref_path)
         except (LookupError, ValueError):
             # pylint: disable=W0707
             raise FlatteningError(f"Invalid ref: {ref_path}")
+        self._ref_index[ref_path] = found
+        return found
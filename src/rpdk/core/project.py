@@ -884,10 +884,12 @@ class Project:  # pylint: disable=too-many-instance-attributes,too-many-public-m
 
         LOG.debug("Writing generated docs")
 
-        # take care not to modify the master schema
-        docs_schema = json.loads(json.dumps(docs_attribute))
+        # take care not to modify the master schema. serialize once, and parse
+        # separate copies for the docs and the flattener
+        docs_attribute_json = json.dumps(docs_attribute)
+        docs_schema = json.loads(docs_attribute_json)
         self._flattened_schema = JsonSchemaFlattener(
-            json.loads(json.dumps(docs_attribute))
+            json.loads(docs_attribute_json)
         ).flatten_schema()
 
         docs_schema["properties"] = {
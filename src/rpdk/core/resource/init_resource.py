@@ -1,5 +1,6 @@
 import logging
 import re
+from functools import cached_property, lru_cache
 
 from rpdk.core.exceptions import WizardAbortError, WizardValidationError
 from rpdk.core.plugin_registry import get_plugin_choices
@@ -47,6 +48,7 @@ def input_typename():
 
 def input_language():
     # language/plugin
+    validate_plugin_choice = get_validate_plugin_choice()
     if validate_plugin_choice.max < 1:
         LOG.critical("No language plugins found")
         raise WizardAbortError()
@@ -77,10 +79,13 @@ class ValidatePluginChoice:
         self.choices = tuple(choices)
         self.max = len(self.choices)
 
+    @cached_property
+    def message(self):
+        # only needed when prompting, i.e. not if a language was passed in
         pretty = "\n".join(
             f"[{i}] {choice}" for i, choice in enumerate(self.choices, 1)
         )
-        self.message = (
+        return (
             "Select a language for code generation:\n"
             + pretty
             + "\n(enter an integer): "
@@ -97,6 +102,7 @@ class ValidatePluginChoice:
         return self.choices[choice]
 
 
-validate_plugin_choice = ValidatePluginChoice(  # pylint: disable=invalid-name
-    get_plugin_choices()
-)
+@lru_cache(maxsize=1)
+def get_validate_plugin_choice():
+    # scanning the plugin entry points is slow, so only do it when prompting
+    return ValidatePluginChoice(get_plugin_choices())
@@ -9,12 +9,14 @@ import re
 from argparse import SUPPRESS
 from collections import OrderedDict
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import gettempdir
 
 import pytest
 from jsonschema import Draft6Validator
 from jsonschema.exceptions import ValidationError
+from pkg_resources import resource_filename
 
 from rpdk.core.contract.hook_client import HookClient
 from rpdk.core.jsonutils.pointer import fragment_decode
@@ -24,7 +26,6 @@ from .boto_helpers import create_sdk_session, get_temporary_credentials
 from .contract.contract_plugin import ContractPlugin
 from .contract.interface import Action, HookInvocationPoint
 from .contract.resource_client import ResourceClient
-from .data_loaders import copy_resource
 from .exceptions import SysExitRecommendedError
 from .project import ARTIFACT_TYPE_HOOK, ARTIFACT_TYPE_MODULE, Project
 
@@ -36,6 +37,16 @@ DEFAULT_PROFILE = None
 DEFAULT_REGION = "us-east-1"
 DEFAULT_TIMEOUT = "240"
 INPUTS = "inputs"
+# pytest markers of the resource contract tests, in Action order so the
+# generated marker expression is stable
+RESOURCE_MARKERS = tuple(action.lower() for action in Action)
+# hook handler name (e.g. preCreate) -> pytest marker (e.g. create_pre_provision)
+HOOK_MARKERS = OrderedDict(
+    (generate_handler_name(invocation_point), invocation_point.lower())
+    for invocation_point in HookInvocationPoint
+)
+# matches undeclared variables such as {{ MyExport }} in overrides/inputs files
+TEMPLATE_VARIABLE_PATTERN = re.compile(r"{{([-A-Za-z0-9:\s]+?)}}")
 
 RESOURCE_OVERRIDES_VALIDATOR = Draft6Validator(
     {
@@ -70,6 +81,13 @@ HOOK_OVERRIDES_VALIDATOR = Draft6Validator(
 )
 
 
+@lru_cache(maxsize=1024)
+def decode_override_pointer(pointer):
+    # the same pointers tend to be repeated across operations and hook targets.
+    # fragment_decode returns a tuple by default, so sharing results is safe
+    return fragment_decode(pointer, prefix="")
+
+
 def empty_override():
     return {"CREATE": {}}
 
@@ -78,46 +96,48 @@ def empty_hook_override():
     return {"CREATE_PRE_PROVISION": {}}
 
 
-# As per Python docs NamedTemporaryFile does NOT work the same in Windows.  Setting delete=False as workaround.
-#
-# Temporary file must be explicitly cleaned up after temporary_ini_file() is called!
-#
-# "Whether the name can be used to open the file a second time, while the named temporary file is still open,
-# varies across platforms (it can be so used on Unix; it cannot on Windows)."
-# https://docs.python.org/3.9/library/tempfile.html#tempfile.NamedTemporaryFile
-#
-# Fix being tracked here https://github.com/python/cpython/issues/58451
-
-
 @contextmanager
-def temporary_ini_file():
-    with NamedTemporaryFile(
-        mode="w", encoding="utf-8", prefix="pytest_", suffix=".ini", delete=False
-    ) as temp:
-        LOG.debug("temporary pytest.ini path: %s", temp.name)
-        path = Path(temp.name).resolve(strict=True)
-        copy_resource(__name__, "data/pytest-contract.ini", path)
-        # Close temporary file for other processes to use, needed on Windows
-        temp.close()
-        yield str(path)
+def packaged_ini_file():
+    """Yield the path of the packaged pytest-contract.ini.
+
+    This is not a temporary file and must not be deleted. When installed
+    unzipped, it is the packaged file itself. A zipped install extracts it
+    once to the pkg_resources cache.
+    """
+    path = resource_filename(__name__, "data/pytest-contract.ini")
+    LOG.debug("pytest.ini path: %s", path)
+    yield path
 
 
 def get_cloudformation_exports(
     region_name, endpoint_url, role_arn, profile_name, headers
+):
+    # the overrides and every inputs file are rendered separately, so cache
+    # the exports instead of listing them again for each file. headers is a
+    # dict and can't be used as a cache key as-is
+    header_items = tuple(sorted(headers.items())) if headers else ()
+    return _get_cloudformation_exports(
+        region_name, endpoint_url, role_arn, profile_name, header_items
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_cloudformation_exports(
+    region_name, endpoint_url, role_arn, profile_name, header_items
 ):
     session = create_sdk_session(region_name, profile_name)
     temp_credentials = get_temporary_credentials(
-        session, role_arn=role_arn, headers=headers
+        session, role_arn=role_arn, headers=dict(header_items)
     )
     cfn_client = session.client(
         "cloudformation", endpoint_url=endpoint_url, **temp_credentials
     )
     paginator = cfn_client.get_paginator("list_exports")
-    pages = paginator.paginate()
-    exports = {}
-    for page in pages:
-        exports.update({export["Name"]: export["Value"] for export in page["Exports"]})
-    return exports
+    return {
+        export["Name"]: export["Value"]
+        for page in paginator.paginate()
+        for export in page["Exports"]
+    }
 
 
 def _stub_exports(template, exports, pattern):
@@ -132,14 +152,15 @@ def _stub_exports(template, exports, pattern):
             ) from e
         return value_to_stub
 
-    return re.sub(pattern, __retrieve_args, template)
+    return pattern.sub(__retrieve_args, template)
 
 
 def render_template(
     overrides_string, region_name, endpoint_url, role_arn, profile_name, headers
 ):
-    regex = r"{{([-A-Za-z0-9:\s]+?)}}"
-    variables = set(str(match).strip() for match in re.findall(regex, overrides_string))
+    variables = {
+        match.strip() for match in TEMPLATE_VARIABLE_PATTERN.findall(overrides_string)
+    }
     if variables:
         exports = get_cloudformation_exports(
             region_name, endpoint_url, role_arn, profile_name, headers
@@ -152,7 +173,9 @@ def render_template(
             )
             LOG.warning(invalid_exports_message, invalid_exports)
             return empty_override()
-        to_return = json.loads(_stub_exports(overrides_string, exports, regex))
+        to_return = json.loads(
+            _stub_exports(overrides_string, exports, TEMPLATE_VARIABLE_PATTERN)
+        )
     else:
         to_return = json.loads(overrides_string)
     return to_return
@@ -176,19 +199,20 @@ def get_overrides(root, region_name, endpoint_url, role_arn, profile_name, heade
 
     path = root / "overrides.json"
     try:
-        with path.open("r", encoding="utf-8") as f:
-            overrides_raw = render_template(
-                f.read(),
-                region_name,
-                endpoint_url,
-                role_arn,
-                profile_name,
-                headers=headers,
-            )
+        overrides_string = path.read_text(encoding="utf-8")
     except FileNotFoundError:
         LOG.debug("Override file '%s' not found. No overrides will be applied", path)
         return empty_override()
 
+    overrides_raw = render_template(
+        overrides_string,
+        region_name,
+        endpoint_url,
+        role_arn,
+        profile_name,
+        headers=headers,
+    )
+
     try:
         RESOURCE_OVERRIDES_VALIDATOR.validate(overrides_raw)
     except ValidationError as e:
@@ -200,7 +224,7 @@ def get_overrides(root, region_name, endpoint_url, role_arn, profile_name, heade
         items = {}
         for pointer, obj in items_raw.items():
             try:
-                pointer = fragment_decode(pointer, prefix="")
+                pointer = decode_override_pointer(pointer)
             except ValueError:
                 LOG.warning("%s pointer '%s' is invalid. Skipping", operation, pointer)
             else:
@@ -220,19 +244,20 @@ def get_hook_overrides(
 
     path = root / "overrides.json"
     try:
-        with path.open("r", encoding="utf-8") as f:
-            overrides_raw = render_template(
-                f.read(),
-                region_name,
-                endpoint_url,
-                role_arn,
-                profile_name,
-                headers=headers,
-            )
+        overrides_string = path.read_text(encoding="utf-8")
     except FileNotFoundError:
         LOG.debug("Override file '%s' not found. No overrides will be applied", path)
         return empty_hook_override()
 
+    overrides_raw = render_template(
+        overrides_string,
+        region_name,
+        endpoint_url,
+        role_arn,
+        profile_name,
+        headers=headers,
+    )
+
     try:
         HOOK_OVERRIDES_VALIDATOR.validate(overrides_raw)
     except ValidationError as e:
@@ -259,7 +284,7 @@ def get_hook_overrides(
                 items = {}
                 for pointer, obj in items_raw.items():
                     try:
-                        pointer = fragment_decode(pointer, prefix="")
+                        pointer = decode_override_pointer(pointer)
                     except ValueError:  # pragma: no cover
                         LOG.warning(
                             "%s pointer '%s' is invalid. Skipping", operation, pointer
@@ -293,20 +318,14 @@ def get_inputs(root, region_name, endpoint_url, value, role_arn, profile_name, h
                 if not input_type:
                     continue
 
-                file_path = path / file
-                with file_path.open("r", encoding="utf-8") as f:
-                    overrides_raw = render_template(
-                        f.read(),
-                        region_name,
-                        endpoint_url,
-                        role_arn,
-                        profile_name,
-                        headers=headers,
-                    )
-                overrides = {}
-                for pointer, obj in overrides_raw.items():
-                    overrides[pointer] = obj
-                inputs[input_type] = overrides
+                inputs[input_type] = render_template(
+                    (path / file).read_text(encoding="utf-8"),
+                    region_name,
+                    endpoint_url,
+                    role_arn,
+                    profile_name,
+                    headers=headers,
+                )
         return inputs
     return None
 
@@ -334,28 +353,26 @@ def get_type(file_name):
     return None
 
 
-def get_resource_marker_options(schema):
-    lowercase_actions = [action.lower() for action in Action]
-    handlers = schema.get("handlers", {}).keys()
-    return [action for action in lowercase_actions if action not in handlers]
-
+def get_resource_marker_options(handlers):
+    return [action for action in RESOURCE_MARKERS if action not in handlers]
 
-def get_hook_marker_options(schema):
-    handlers = schema.get("handlers", {}).keys()
-    action_to_handler = OrderedDict()
-    for invocation_point in HookInvocationPoint:
-        handler_name = generate_handler_name(invocation_point)
-        action_to_handler[handler_name] = invocation_point.lower()
 
-    excluded_actions = [
-        action for action in action_to_handler.keys() if action not in handlers
+def get_hook_marker_options(handlers):
+    return [
+        marker for handler, marker in HOOK_MARKERS.items() if handler not in handlers
     ]
-    return [action_to_handler[excluded_action] for excluded_action in excluded_actions]
 
 
 def get_marker_options(schema):
-    excluded_actions = get_resource_marker_options(schema) + get_hook_marker_options(
-        schema
+    # invoked for every inputs file with the same schema, so key the cache on
+    # the (hashable) set of declared handlers
+    return _get_marker_options(frozenset(schema.get("handlers", {})))
+
+
+@lru_cache(maxsize=4)
+def _get_marker_options(handlers):
+    excluded_actions = get_resource_marker_options(handlers) + get_hook_marker_options(
+        handlers
     )
     marker_list = ["not " + action for action in excluded_actions]
     return " and ".join(marker_list)
@@ -461,18 +478,22 @@ def test(args):
 def invoke_test(args, project, overrides, inputs):
     plugin_clients = get_contract_plugin_client(args, project, overrides, inputs)
     plugin = ContractPlugin(plugin_clients)
-    with temporary_ini_file() as path:
-        pytest_args = ["-c", path, "-m", get_marker_options(project.schema)]
+    with packaged_ini_file() as path:
+        # pytest uses the ini file's directory as rootdir (and .pytest_cache
+        # location) by default, which must not be the installed package
+        pytest_args = [
+            "-c",
+            path,
+            "--rootdir",
+            gettempdir(),
+            "-m",
+            get_marker_options(project.schema),
+        ]
         if args.passed_to_pytest:
             LOG.debug("extra args: %s", args.passed_to_pytest)
             pytest_args.extend(args.passed_to_pytest)
         LOG.debug("pytest args: %s", pytest_args)
         ret = pytest.main(pytest_args, plugins=[plugin])
-        # Manually clean up temporary file before exiting - issue with NamedTemporaryFile method on Windows
-        try:
-            os.unlink(path)
-        except FileNotFoundError:
-            pass
         if ret:
             raise SysExitRecommendedError("One or more contract tests failed")
 
@@ -0,0 +1,82 @@
+from unittest.mock import Mock, call
+
+import pytest
+
+from rpdk.core.contract.interface import Action, OperationStatus
+from rpdk.core.contract.resource_client import ResourceClient
+from rpdk.core.contract.suite.resource.handler_create import created_resource
+
+EXAMPLE_MODEL = {"a": 1}
+CREATED_MODEL = {"a": 1, "Id": "id"}
+
+
+def _created_resource(resource_client):
+    return created_resource.__wrapped__(resource_client)
+
+
+@pytest.fixture
+def resource_client():
+    client = Mock(spec=ResourceClient)
+    client.generate_create_example.return_value = EXAMPLE_MODEL
+    client.primary_identifier_paths = set()
+    client.read_only_paths = set()
+    client.write_only_paths = set()
+    client.create_only_paths = set()
+    client.properties_without_insertion_order = []
+    return client
+
+
+def test_created_resource_deletes_after_use(resource_client):
+    resource_client.call_and_assert.return_value = (
+        OperationStatus.SUCCESS,
+        {"resourceModel": EXAMPLE_MODEL},
+        None,
+    )
+    fixture = _created_resource(resource_client)
+    assert next(fixture) == (EXAMPLE_MODEL, EXAMPLE_MODEL, EXAMPLE_MODEL)
+    with pytest.raises(StopIteration):
+        next(fixture)
+
+    resource_client.call_and_assert.assert_called_with(
+        Action.DELETE, OperationStatus.SUCCESS, EXAMPLE_MODEL
+    )
+
+
+def test_created_resource_deletes_when_create_assertion_fails(resource_client):
+    # the handler returned SUCCESS and provisioned the resource, but the
+    # response failed an assertion (e.g. the model does not match the input)
+    resource_client.call_and_assert.return_value = (
+        OperationStatus.SUCCESS,
+        {"resourceModel": CREATED_MODEL},
+        None,
+    )
+    resource_client.compare.side_effect = AssertionError("mismatch")
+    with pytest.raises(AssertionError, match="mismatch"):
+        next(_created_resource(resource_client))
+
+    assert resource_client.call_and_assert.call_args_list == [
+        call(Action.CREATE, OperationStatus.SUCCESS, EXAMPLE_MODEL),
+        call(Action.DELETE, OperationStatus.SUCCESS, CREATED_MODEL),
+    ]
+
+
+def test_created_resource_failed_cleanup_keeps_original_error(resource_client):
+    resource_client.call_and_assert.side_effect = [
+        AssertionError("create"),
+        AssertionError("delete"),
+    ]
+    with pytest.raises(AssertionError, match="create"):
+        next(_created_resource(resource_client))
+
+    resource_client.call_and_assert.assert_called_with(
+        Action.DELETE, OperationStatus.SUCCESS, EXAMPLE_MODEL
+    )
+
+
+def test_created_resource_interrupt_during_cleanup_propagates(resource_client):
+    resource_client.call_and_assert.side_effect = [
+        AssertionError("create"),
+        KeyboardInterrupt,
+    ]
+    with pytest.raises(KeyboardInterrupt):
+        next(_created_resource(resource_client))
@@ -1,5 +1,6 @@
 # fixture and parameter have the same name
 # pylint: disable=redefined-outer-name,protected-access
+import json
 import logging
 import time
 from io import StringIO
@@ -873,6 +874,24 @@ def test_invalid_strategy(resource_client):
     assert resource_client._invalid_strategy is invalid_strategy
 
 
+def test_strategies_share_serialized_schema(resource_client):
+    schema = {
+        "properties": {"a": {"type": "number", "const": 1}},
+        "readOnlyProperties": ["/properties/a"],
+    }
+    resource_client._update_schema(schema)
+
+    with patch(
+        "rpdk.core.contract.resource_client.json.dumps", wraps=json.dumps
+    ) as mock_dumps:
+        assert resource_client.strategy.example() == {}
+        assert resource_client.invalid_strategy.example() == {"a": 1}
+        assert resource_client.update_strategy.example() == {}
+
+    mock_dumps.assert_called_once_with(schema)
+    assert schema["properties"] == {"a": {"type": "number", "const": 1}}
+
+
 def test_update_strategy(resource_client):
     schema = {
         "properties": {
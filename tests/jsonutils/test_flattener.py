@@ -7,7 +7,7 @@ import pytest
 from rpdk.core.data_loaders import resource_json
 from rpdk.core.jsonutils.flattener import COMBINERS, JsonSchemaFlattener
 from rpdk.core.jsonutils.pointer import fragment_encode
-from rpdk.core.jsonutils.utils import ConstraintError, FlatteningError
+from rpdk.core.jsonutils.utils import ConstraintError, FlatteningError, traverse
 
 from .area_definition_flattened import AREA_DEFINITION_FLATTENED
 
@@ -169,6 +169,18 @@ def test_find_schema_from_ref_valid_path(path, subschema):
     assert found == subschema
 
 
+def test_find_schema_from_ref_is_indexed():
+    test_schema = {"a": {"b": {"c": "d"}}}
+    flattener = JsonSchemaFlattener(test_schema)
+    with patch(
+        "rpdk.core.jsonutils.flattener.traverse", wraps=traverse
+    ) as mock_traverse:
+        first = flattener._find_subschema_by_ref(("a", "b"))
+        second = flattener._find_subschema_by_ref(("a", "b"))
+    mock_traverse.assert_called_once_with(test_schema, ("a", "b"))
+    assert first is second
+
+
 def test_find_schema_from_ref_invalid_path():
     flattener = JsonSchemaFlattener({"a": "b"})
     ref = ("b",)
@@ -24,21 +24,28 @@ def test_input_typename():
 
 def test_input_language_no_plugins():
     validator = ValidatePluginChoice([])
-    with patch("rpdk.core.resource.init_resource.validate_plugin_choice", validator):
+    with patch(
+        "rpdk.core.resource.init_resource.get_validate_plugin_choice",
+        return_value=validator,
+    ):
         with pytest.raises(WizardAbortError):
             input_language()
 
 
 def test_input_language_one_plugin():
     validator = ValidatePluginChoice([PROMPT])
-    with patch("rpdk.core.resource.init_resource.validate_plugin_choice", validator):
+    with patch(
+        "rpdk.core.resource.init_resource.get_validate_plugin_choice",
+        return_value=validator,
+    ):
         assert input_language() == PROMPT
 
 
 def test_input_language_several_plugins():
     validator = ValidatePluginChoice(["1", PROMPT, "2"])
     patch_validator = patch(
-        "rpdk.core.resource.init_resource.validate_plugin_choice", validator
+        "rpdk.core.resource.init_resource.get_validate_plugin_choice",
+        return_value=validator,
     )
     patch_input = patch("rpdk.core.utils.init_utils.input", return_value="2")
     with patch_validator, patch_input as mock_input:
@@ -156,9 +156,10 @@ def test_get_temporary_credentials_assume_role_fails():
     )
     session.region_name = "us-east-2"
 
-    with pytest.raises(DownstreamError):
+    with pytest.raises(DownstreamError) as excinfo:
         get_temporary_credentials(session, role_arn=EXPECTED_ROLE)
 
+    assert EXPECTED_ROLE in str(excinfo.value.__cause__)
     session.client.assert_called_once_with(
         "sts",
         endpoint_url="https://sts.us-east-2.amazonaws.com",
@@ -1,10 +1,17 @@
 import logging
+from logging.config import dictConfig
 from unittest.mock import patch
 
 import pytest
 
 from rpdk.core import __version__
-from rpdk.core.cli import EXIT_UNHANDLED_EXCEPTION, main, setup_logging
+from rpdk.core.cli import (
+    EXIT_UNHANDLED_EXCEPTION,
+    SUBCOMMAND_MODULES,
+    main,
+    selected_subcommand,
+    setup_logging,
+)
 from rpdk.core.exceptions import DownstreamError, SysExitRecommendedError
 
 from .utils import chdir
@@ -70,6 +77,27 @@ def test_setup_logging_console_two_verbosity(tmpdir, capsys):
     assert_all_messages_logged(cwd)
 
 
+def test_setup_logging_only_configures_once(tmpdir, capsys):
+    with chdir(tmpdir):
+        with patch("rpdk.core.cli.dictConfig", wraps=dictConfig) as mock_config:
+            setup_logging(0)
+            setup_logging(2)
+        mock_config.assert_called_once()
+        out, _err = setup_logging_do_logging_and_capture("rpdk", capsys, 2)
+    assert DEBUG_MSG in out
+
+
+def test_setup_logging_reconfigures_for_new_directory(tmp_path):
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    for directory in (first, second):
+        with chdir(directory):
+            setup_logging(2)
+            logging.getLogger("rpdk").debug(DEBUG_MSG)
+        assert DEBUG_MSG in (directory / "rpdk.log").read_text(encoding="utf-8")
+
+
 def test_main_no_args_prints_help(capsys):
     main(args_in=[])
     out, err = capsys.readouterr()
@@ -86,6 +114,37 @@ def test_main_setup_extensions():
     extensions_setup_subparser.assert_called_once()
 
 
+def test_main_only_sets_up_selected_subcommand():
+    with patch("rpdk.core.init.setup_subparser") as init_setup_subparser, patch(
+        "rpdk.core.validate.setup_subparser"
+    ) as validate_setup_subparser:
+        with pytest.raises(SystemExit):
+            main(args_in=["validate", "--unknown"])
+
+    init_setup_subparser.assert_not_called()
+    validate_setup_subparser.assert_called_once()
+
+
+def test_main_help_lists_all_subcommands(capsys):
+    main(args_in=[])
+    out, _err = capsys.readouterr()
+    for command_name in SUBCOMMAND_MODULES:
+        assert command_name in out
+
+
+@pytest.mark.parametrize(
+    "args_in,expected",
+    [
+        ([], None),
+        (["--version"], None),
+        (["init", "-v"], "init"),
+        (["-h", "test"], "test"),
+    ],
+)
+def test_selected_subcommand(args_in, expected):
+    assert selected_subcommand(args_in) == expected
+
+
 def test_main_version_arg_prints_version(capsys):
     main(args_in=["--version"])
     out, err = capsys.readouterr()
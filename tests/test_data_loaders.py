@@ -702,3 +702,8 @@ def test_get_schema_store_schemas_with_out_id():
         BASEDIR.parent / "src" / "rpdk" / "core" / "data" / "examples" / "resource"
     )
     assert len(schema_store) == 0
+
+
+def test_get_schema_store_is_cached():
+    schema_search_path = BASEDIR.parent / "src" / "rpdk" / "core" / "data" / "schema"
+    assert get_schema_store(schema_search_path) is get_schema_store(schema_search_path)
@@ -478,6 +478,12 @@ def test_validate_plugin_choice_valid():
     assert validator("2") == PROMPT
 
 
+def test_validate_plugin_choice_message():
+    validator = ValidatePluginChoice(["1", PROMPT])
+    assert "message" not in vars(validator)
+    assert f"[1] 1\n[2] {PROMPT}\n" in validator.message
+
+
 def test_init_module_method_noninteractive():
     add_dummy_language_plugin()
     artifact_type = "MODULE"
@@ -621,20 +627,22 @@ def test_input_typename_hook():
 
 def test_input_language_no_plugins():
     validator = ValidatePluginChoice([])
-    with patch("rpdk.core.init.validate_plugin_choice", validator):
+    with patch("rpdk.core.init.get_validate_plugin_choice", return_value=validator):
         with pytest.raises(WizardAbortError):
             input_language()
 
 
 def test_input_language_one_plugin():
     validator = ValidatePluginChoice([PROMPT])
-    with patch("rpdk.core.init.validate_plugin_choice", validator):
+    with patch("rpdk.core.init.get_validate_plugin_choice", return_value=validator):
         assert input_language() == PROMPT
 
 
 def test_input_language_several_plugins():
     validator = ValidatePluginChoice(["1", PROMPT, "2"])
-    patch_validator = patch("rpdk.core.init.validate_plugin_choice", validator)
+    patch_validator = patch(
+        "rpdk.core.init.get_validate_plugin_choice", return_value=validator
+    )
     patch_input = patch("rpdk.core.init.input", return_value="2")
     with patch_validator, patch_input as mock_input:
         assert input_language() == PROMPT
@@ -464,8 +464,8 @@ def test_safewrite_overwrite(project):
     mock_overwrite.assert_called_once_with(path, contents)
 
 
-def test_safewrite_doesnt_exist(project, tmpdir):
-    path = Path(tmpdir.join("test")).resolve()
+def test_safewrite_doesnt_exist(project, tmp_path):
+    path = tmp_path / "test"
 
     with patch.object(project, "overwrite_enabled", False):
         project.safewrite(path, CONTENTS_UTF8)
@@ -474,9 +474,9 @@ def test_safewrite_doesnt_exist(project, tmpdir):
         assert f.read() == CONTENTS_UTF8
 
 
-def test_safewrite_exists(project, tmpdir, caplog):
+def test_safewrite_exists(project, tmp_path, caplog):
     caplog.set_level(logging.INFO)
-    path = Path(tmpdir.join("test")).resolve()
+    path = tmp_path / "test"
 
     with path.open("w", encoding="utf-8") as f:
         f.write(CONTENTS_UTF8)
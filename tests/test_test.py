@@ -1,10 +1,11 @@
 # fixture and parameter have the same name
 # pylint: disable=protected-access,redefined-outer-name
 import json
-import os
 from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import Mock, patch
+from tempfile import gettempdir
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
 
@@ -22,35 +23,54 @@ from rpdk.core.test import (
     DEFAULT_FUNCTION,
     DEFAULT_PROFILE,
     DEFAULT_REGION,
+    HOOK_OVERRIDES_VALIDATOR,
+    RESOURCE_OVERRIDES_VALIDATOR,
+    TEMPLATE_VARIABLE_PATTERN,
+    _get_cloudformation_exports,
     _stub_exports,
     _validate_sam_args,
     empty_hook_override,
     empty_override,
+    get_cloudformation_exports,
     get_hook_overrides,
     get_inputs,
     get_marker_options,
     get_overrides,
-    temporary_ini_file,
+    packaged_ini_file,
 )
 from rpdk.core.utils.handler_utils import generate_handler_name
 
 RANDOM_INI = "pytest_SOYPKR.ini"
-EMPTY_RESOURCE_OVERRIDE = empty_override()
-EMPTY_HOOK_OVERRIDE = empty_hook_override()
+# expected values only, frozen so no test can modify them by accident
+EMPTY_RESOURCE_OVERRIDE = MappingProxyType(
+    {key: MappingProxyType(value) for key, value in empty_override().items()}
+)
+# serialized once for the tests that write it to overrides.json
+EMPTY_RESOURCE_OVERRIDE_JSON = json.dumps(empty_override())
+EMPTY_HOOK_OVERRIDE = MappingProxyType(
+    {key: MappingProxyType(value) for key, value in empty_hook_override().items()}
+)
 ROLE_ARN = "role_arn"
 CREDENTIALS = {
     "AccessKeyId": object(),
     "SecretAccessKey": object(),
     "SessionToken": object(),
 }
+# a single page of ListExports results, shared since it is only iterated
+TEST_EXPORT_PAGES = ({"Exports": ({"Value": "TestValue", "Name": "TestExport"},)},)
 
 
-RESOURCE_SCHEMA = {"handlers": {generate_handler_name(action): [] for action in Action}}
-HOOK_SCHEMA = {
-    "handlers": {
-        generate_handler_name(invoke_point): [] for invoke_point in HookInvocationPoint
+# shared by every test, so frozen to catch accidental mutation
+RESOURCE_SCHEMA = MappingProxyType(
+    {"handlers": MappingProxyType({generate_handler_name(a): () for a in Action})}
+)
+HOOK_SCHEMA = MappingProxyType(
+    {
+        "handlers": MappingProxyType(
+            {generate_handler_name(ip): () for ip in HookInvocationPoint}
+        )
     }
-}
+)
 
 HOOK_TARGET_INFO = {
     "My::Example::Resource": {
@@ -88,15 +108,64 @@ HOOK_TARGET_INFO = {
 
 
 @pytest.fixture
-def base(tmpdir):
-    return Path(tmpdir)
+def base(tmp_path):
+    return tmp_path
+
+
+@pytest.fixture
+def mock_paginator():
+    mock_sts_client = Mock(spec=["get_session_token"])
+    mock_sts_client.get_session_token.return_value = CREDENTIALS
+    mock_cfn_client = Mock(spec=["get_paginator"])
+    mock_paginator = Mock(spec=["paginate"])
+    mock_cfn_client.get_paginator.return_value = mock_paginator
+    patch_sdk = patch("rpdk.core.test.create_sdk_session", autospec=True)
+    with patch_sdk as mock_sdk:
+        mock_sdk.return_value.region_name = "us-east-1"
+        mock_sdk.return_value.client.side_effect = [
+            mock_sts_client,
+            mock_cfn_client,
+            Mock(),
+        ]
+        yield mock_paginator
+
+
+@pytest.fixture(autouse=True)
+def clear_exports_cache():
+    _get_cloudformation_exports.cache_clear()
+    yield
+    _get_cloudformation_exports.cache_clear()
 
 
 @contextmanager
-def mock_temporary_ini_file():
+def mock_packaged_ini_file():
     yield RANDOM_INI
 
 
+@pytest.fixture
+def patched_test_env():
+    patch_test = patch.multiple(
+        "rpdk.core.test",
+        autospec=True,
+        Project=DEFAULT,
+        ContractPlugin=DEFAULT,
+        ResourceClient=DEFAULT,
+        HookClient=DEFAULT,
+        packaged_ini_file=DEFAULT,
+    )
+    patch_pytest = patch("rpdk.core.test.pytest.main", autospec=True, return_value=0)
+    with patch_test as mocks, patch_pytest as mock_pytest:
+        mocks["packaged_ini_file"].side_effect = mock_packaged_ini_file
+        yield SimpleNamespace(
+            project=mocks["Project"],
+            plugin=mocks["ContractPlugin"],
+            resource_client=mocks["ResourceClient"],
+            hook_client=mocks["HookClient"],
+            pytest=mock_pytest,
+            ini=mocks["packaged_ini_file"],
+        )
+
+
 def _get_expected_marker_options(artifact_type):
     resource_actions = [op.lower() for op in Action]
     hook_actions = [op.lower() for op in HookInvocationPoint]
@@ -129,7 +198,7 @@ def _get_expected_marker_options(artifact_type):
 )
 def test_stub_exports(template_string, exports, expected):
     assert expected == _stub_exports(
-        template_string, exports, r"{{([-A-Za-z0-9:\s]+?)}}"
+        template_string, exports, TEMPLATE_VARIABLE_PATTERN
     )
 
 
@@ -144,7 +213,7 @@ def test_stub_exports(template_string, exports, expected):
 )
 def test_stub_exports_exception(template_string, exports):
     with pytest.raises(ValueError) as e:
-        _stub_exports(template_string, exports, r"{{([-A-Za-z0-9:\s]+?)}}")
+        _stub_exports(template_string, exports, TEMPLATE_VARIABLE_PATTERN)
         assert (
             str(e) == "Export does not contain provided undeclared variable 'lastname'"
         )
@@ -152,79 +221,79 @@ def test_stub_exports_exception(template_string, exports):
 
 def create_input_file(base, create_string, update_string, invalid_string):
     path = base / "inputs"
-    os.mkdir(path, mode=0o777)
-
-    path_create = path / "inputs_1_create.json"
-    with path_create.open("w", encoding="utf-8") as f:
-        f.write(create_string)
+    path.mkdir()
 
-    path_update = path / "inputs_1_update.json"
-    with path_update.open("w", encoding="utf-8") as f:
-        f.write(update_string)
-
-    path_invalid = path / "inputs_1_invalid.json"
-    with path_invalid.open("w", encoding="utf-8") as f:
-        f.write(invalid_string)
+    (path / "inputs_1_create.json").write_text(create_string, encoding="utf-8")
+    (path / "inputs_1_update.json").write_text(update_string, encoding="utf-8")
+    (path / "inputs_1_invalid.json").write_text(invalid_string, encoding="utf-8")
 
 
 def create_invalid_input_file(base):
     path = base / "inputs"
-    os.mkdir(path, mode=0o777)
-
-    path_create = path / "inputs_1_test.json"
-    with path_create.open("w", encoding="utf-8") as f:
-        f.write('{"a": 1}')
+    path.mkdir()
+
+    (path / "inputs_1_test.json").write_text('{"a": 1}', encoding="utf-8")
+
+
+HAPPY_PATH_CASES = [
+    (
+        [],
+        [],
+        [
+            DEFAULT_FUNCTION,
+            DEFAULT_ENDPOINT,
+            DEFAULT_REGION,
+            "240",
+            DEFAULT_PROFILE,
+        ],
+    ),
+    (
+        ["--endpoint", "foo"],
+        [],
+        [DEFAULT_FUNCTION, "foo", DEFAULT_REGION, "240", DEFAULT_PROFILE],
+    ),
+    (
+        ["--function-name", "bar", "--enforce-timeout", "60"],
+        [],
+        ["bar", DEFAULT_ENDPOINT, DEFAULT_REGION, "60", DEFAULT_PROFILE],
+    ),
+    (
+        ["--", "-k", "create"],
+        ["-k", "create"],
+        [
+            DEFAULT_FUNCTION,
+            DEFAULT_ENDPOINT,
+            DEFAULT_REGION,
+            "240",
+            DEFAULT_PROFILE,
+        ],
+    ),
+    (
+        ["--region", "us-west-2", "--", "--collect-only"],
+        ["--collect-only"],
+        [DEFAULT_FUNCTION, DEFAULT_ENDPOINT, "us-west-2", "240", DEFAULT_PROFILE],
+    ),
+    (
+        ["--profile", "sandbox"],
+        [],
+        [DEFAULT_FUNCTION, DEFAULT_ENDPOINT, DEFAULT_REGION, "240", "sandbox"],
+    ),
+]
+HAPPY_PATH_IDS = [
+    "default",
+    "endpoint",
+    "function",
+    "k_create",
+    "collect_only",
+    "profile",
+]
 
 
 @pytest.mark.parametrize(
-    "args_in,pytest_args,plugin_args",
-    [
-        (
-            [],
-            [],
-            [
-                DEFAULT_FUNCTION,
-                DEFAULT_ENDPOINT,
-                DEFAULT_REGION,
-                "240",
-                DEFAULT_PROFILE,
-            ],
-        ),
-        (
-            ["--endpoint", "foo"],
-            [],
-            [DEFAULT_FUNCTION, "foo", DEFAULT_REGION, "240", DEFAULT_PROFILE],
-        ),
-        (
-            ["--function-name", "bar", "--enforce-timeout", "60"],
-            [],
-            ["bar", DEFAULT_ENDPOINT, DEFAULT_REGION, "60", DEFAULT_PROFILE],
-        ),
-        (
-            ["--", "-k", "create"],
-            ["-k", "create"],
-            [
-                DEFAULT_FUNCTION,
-                DEFAULT_ENDPOINT,
-                DEFAULT_REGION,
-                "240",
-                DEFAULT_PROFILE,
-            ],
-        ),
-        (
-            ["--region", "us-west-2", "--", "--collect-only"],
-            ["--collect-only"],
-            [DEFAULT_FUNCTION, DEFAULT_ENDPOINT, "us-west-2", "240", DEFAULT_PROFILE],
-        ),
-        (
-            ["--profile", "sandbox"],
-            [],
-            [DEFAULT_FUNCTION, DEFAULT_ENDPOINT, DEFAULT_REGION, "240", "sandbox"],
-        ),
-    ],
+    "args_in,pytest_args,plugin_args", HAPPY_PATH_CASES, ids=HAPPY_PATH_IDS
 )
 def test_test_command_happy_path_resource(
-    base, capsys, args_in, pytest_args, plugin_args
+    base, capsys, patched_test_env, args_in, pytest_args, plugin_args
 ):  # pylint: disable=too-many-locals
     create_input_file(base, '{"a": 1}', '{"a": 2}', '{"b": 1}')
     mock_project = Mock(spec=Project)
@@ -233,27 +302,13 @@ def test_test_command_happy_path_resource(
     mock_project.executable_entrypoint = None
     mock_project.artifact_type = ARTIFACT_TYPE_RESOURCE
     marker_options = _get_expected_marker_options(mock_project.artifact_type)
+    patched_test_env.project.return_value = mock_project
 
-    patch_project = patch(
-        "rpdk.core.test.Project", autospec=True, return_value=mock_project
-    )
-    patch_plugin = patch("rpdk.core.test.ContractPlugin", autospec=True)
-    patch_resource_client = patch("rpdk.core.test.ResourceClient", autospec=True)
-    patch_pytest = patch("rpdk.core.test.pytest.main", autospec=True, return_value=0)
-    patch_ini = patch(
-        "rpdk.core.test.temporary_ini_file", side_effect=mock_temporary_ini_file
-    )
-    # fmt: off
-    with patch_project, \
-            patch_plugin as mock_plugin, \
-            patch_resource_client as mock_resource_client, \
-            patch_pytest as mock_pytest, \
-            patch_ini as mock_ini:
-        main(args_in=["test"] + args_in)
-    # fmt: on
+    main(args_in=["test"] + args_in)
 
     mock_project.load.assert_called_once_with()
     function_name, endpoint, region, enforce_timeout, profile = plugin_args
+    mock_resource_client = patched_test_env.resource_client
     mock_resource_client.assert_called_once_with(
         function_name,
         endpoint,
@@ -272,12 +327,14 @@ def test_test_command_happy_path_resource(
         docker_image=None,
         profile=profile,
     )
+    mock_plugin = patched_test_env.plugin
     mock_plugin.assert_called_once_with(
         {"resource_client": mock_resource_client.return_value}
     )
-    mock_ini.assert_called_once_with()
-    mock_pytest.assert_called_once_with(
-        ["-c", RANDOM_INI, "-m", marker_options] + pytest_args,
+    patched_test_env.ini.assert_called_once_with()
+    patched_test_env.pytest.assert_called_once_with(
+        ["-c", RANDOM_INI, "--rootdir", gettempdir(), "-m", marker_options]
+        + pytest_args,
         plugins=[mock_plugin.return_value],
     )
 
@@ -286,54 +343,10 @@ def test_test_command_happy_path_resource(
 
 
 @pytest.mark.parametrize(
-    "args_in,pytest_args,plugin_args",
-    [
-        (
-            [],
-            [],
-            [
-                DEFAULT_FUNCTION,
-                DEFAULT_ENDPOINT,
-                DEFAULT_REGION,
-                "240",
-                DEFAULT_PROFILE,
-            ],
-        ),
-        (
-            ["--endpoint", "foo"],
-            [],
-            [DEFAULT_FUNCTION, "foo", DEFAULT_REGION, "240", DEFAULT_PROFILE],
-        ),
-        (
-            ["--function-name", "bar", "--enforce-timeout", "60"],
-            [],
-            ["bar", DEFAULT_ENDPOINT, DEFAULT_REGION, "60", DEFAULT_PROFILE],
-        ),
-        (
-            ["--", "-k", "create"],
-            ["-k", "create"],
-            [
-                DEFAULT_FUNCTION,
-                DEFAULT_ENDPOINT,
-                DEFAULT_REGION,
-                "240",
-                DEFAULT_PROFILE,
-            ],
-        ),
-        (
-            ["--region", "us-west-2", "--", "--collect-only"],
-            ["--collect-only"],
-            [DEFAULT_FUNCTION, DEFAULT_ENDPOINT, "us-west-2", "240", DEFAULT_PROFILE],
-        ),
-        (
-            ["--profile", "sandbox"],
-            [],
-            [DEFAULT_FUNCTION, DEFAULT_ENDPOINT, DEFAULT_REGION, "240", "sandbox"],
-        ),
-    ],
+    "args_in,pytest_args,plugin_args", HAPPY_PATH_CASES, ids=HAPPY_PATH_IDS
 )
 def test_test_command_happy_path_hook(
-    base, capsys, args_in, pytest_args, plugin_args
+    base, capsys, patched_test_env, args_in, pytest_args, plugin_args
 ):  # pylint: disable=too-many-locals
     mock_project = Mock(spec=Project)
     mock_project.schema = HOOK_SCHEMA
@@ -342,27 +355,13 @@ def test_test_command_happy_path_hook(
     mock_project.executable_entrypoint = None
     mock_project._load_target_info.return_value = HOOK_TARGET_INFO
     marker_options = _get_expected_marker_options(mock_project.artifact_type)
+    patched_test_env.project.return_value = mock_project
 
-    patch_project = patch(
-        "rpdk.core.test.Project", autospec=True, return_value=mock_project
-    )
-    patch_plugin = patch("rpdk.core.test.ContractPlugin", autospec=True)
-    patch_hook_client = patch("rpdk.core.test.HookClient", autospec=True)
-    patch_pytest = patch("rpdk.core.test.pytest.main", autospec=True, return_value=0)
-    patch_ini = patch(
-        "rpdk.core.test.temporary_ini_file", side_effect=mock_temporary_ini_file
-    )
-    # fmt: off
-    with patch_project, \
-            patch_plugin as mock_plugin, \
-            patch_hook_client as mock_hook_client, \
-            patch_pytest as mock_pytest, \
-            patch_ini as mock_ini:
-        main(args_in=["test"] + args_in)
-    # fmt: on
+    main(args_in=["test"] + args_in)
 
     mock_project.load.assert_called_once_with()
     function_name, endpoint, region, enforce_timeout, profile = plugin_args
+    mock_hook_client = patched_test_env.hook_client
     mock_hook_client.assert_called_once_with(
         function_name,
         endpoint,
@@ -382,10 +381,12 @@ def test_test_command_happy_path_hook(
         target_info=HOOK_TARGET_INFO,
         profile=profile,
     )
+    mock_plugin = patched_test_env.plugin
     mock_plugin.assert_called_once_with({"hook_client": mock_hook_client.return_value})
-    mock_ini.assert_called_once_with()
-    mock_pytest.assert_called_once_with(
-        ["-c", RANDOM_INI, "-m", marker_options] + pytest_args,
+    patched_test_env.ini.assert_called_once_with()
+    patched_test_env.pytest.assert_called_once_with(
+        ["-c", RANDOM_INI, "--rootdir", gettempdir(), "-m", marker_options]
+        + pytest_args,
         plugins=[mock_plugin.return_value],
     )
 
@@ -393,116 +394,90 @@ def test_test_command_happy_path_hook(
     assert not err
 
 
-def test_test_command_return_code_on_error():
-    mock_project = Mock(spec=Project)
-
+def test_test_command_return_code_on_error(patched_test_env):
+    mock_project = Mock(
+        spec_set=[
+            "load",
+            "root",
+            "schema",
+            "executable_entrypoint",
+            "artifact_type",
+            "type_name",
+        ]
+    )
     mock_project.root = None
     mock_project.schema = RESOURCE_SCHEMA
     mock_project.executable_entrypoint = None
     mock_project.artifact_type = ARTIFACT_TYPE_RESOURCE
-    patch_project = patch(
-        "rpdk.core.test.Project", autospec=True, return_value=mock_project
-    )
-    patch_plugin = patch("rpdk.core.test.ContractPlugin", autospec=True)
-    patch_client = patch("rpdk.core.test.ResourceClient", autospec=True)
-    patch_pytest = patch("rpdk.core.test.pytest.main", autospec=True, return_value=1)
-    with patch_project, patch_plugin, patch_client, patch_pytest:
-        with pytest.raises(SystemExit) as excinfo:
-            main(args_in=["test"])
+    patched_test_env.project.return_value = mock_project
+    patched_test_env.pytest.return_value = 1
+    with pytest.raises(SystemExit) as excinfo:
+        main(args_in=["test"])
 
     assert excinfo.value.code != EXIT_UNHANDLED_EXCEPTION
 
 
-def test_test_command_module_project_succeeds():
-    mock_project = Mock(spec=Project)
-
+def test_test_command_module_project_succeeds(patched_test_env):
+    mock_project = Mock(spec_set=["load", "artifact_type"])
     mock_project.artifact_type = ARTIFACT_TYPE_MODULE
-    patch_project = patch(
-        "rpdk.core.test.Project", autospec=True, return_value=mock_project
-    )
-    with patch_project:
-        main(args_in=["test"])
+    patched_test_env.project.return_value = mock_project
+    main(args_in=["test"])
+
+    patched_test_env.pytest.assert_not_called()
 
 
-def test_temporary_ini_file():
-    with temporary_ini_file() as path_str:
+def test_packaged_ini_file():
+    with packaged_ini_file() as path_str:
         assert isinstance(path_str, str)
         path = Path(path_str)
-        assert path.name.startswith("pytest_")
-        assert path.name.endswith(".ini")
+        assert path.name == "pytest-contract.ini"
 
         with path.open("r", encoding="utf-8") as f:
             assert "[pytest]" in f.read()
-        # Manually clean up temporary file before exiting - issue with NamedTemporaryFile method on Windows
-        try:
-            os.unlink(path_str)
-        except FileNotFoundError:
-            pass
-
-
-def test_get_overrides_no_root():
-    assert (
-        get_overrides(None, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
-        == EMPTY_RESOURCE_OVERRIDE
-    )
-
-
-def test_get_overrides_file_not_found(base):
-    path = base / "overrides.json"
-    try:
-        path.unlink()
-    except FileNotFoundError:
-        pass
-    assert (
-        get_overrides(path, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
-        == EMPTY_RESOURCE_OVERRIDE
-    )
+    # the packaged file must survive the context manager
+    assert path.is_file()
 
 
-def test_get_overrides_invalid_file(base):
-    path = base / "overrides.json"
-    path.write_text("{}")
-    assert (
-        get_overrides(base, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
-        == EMPTY_RESOURCE_OVERRIDE
-    )
+@pytest.mark.parametrize(
+    "validator", [RESOURCE_OVERRIDES_VALIDATOR, HOOK_OVERRIDES_VALIDATOR]
+)
+def test_overrides_validator_schema_is_valid(validator):
+    # the override schemas are hand-written, so make sure they are valid draft-6
+    validator.check_schema(validator.schema)
 
 
-def test_get_overrides_empty_overrides(base):
-    path = base / "overrides.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(EMPTY_RESOURCE_OVERRIDE, f)
+def test_get_overrides_no_root():
     assert (
-        get_overrides(base, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
+        get_overrides(None, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
         == EMPTY_RESOURCE_OVERRIDE
     )
 
 
-def test_get_overrides_invalid_pointer_skipped(base):
-    overrides = empty_override()
-    overrides["CREATE"]["#/foo/bar"] = None
-
-    path = base / "overrides.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(overrides, f)
+@pytest.mark.parametrize(
+    "overrides_string,expected",
+    [
+        (None, EMPTY_RESOURCE_OVERRIDE),
+        ("{}", EMPTY_RESOURCE_OVERRIDE),
+        (EMPTY_RESOURCE_OVERRIDE_JSON, EMPTY_RESOURCE_OVERRIDE),
+        ('{"CREATE": {"#/foo/bar": null}}', EMPTY_RESOURCE_OVERRIDE),
+        ('{"CREATE": {"/foo/bar": {}}}', {"CREATE": {("foo", "bar"): {}}}),
+    ],
+    ids=[
+        "file_not_found",
+        "invalid_file",
+        "empty_overrides",
+        "invalid_pointer_skipped",
+        "good_path",
+    ],
+)
+def test_get_overrides(base, overrides_string, expected):
+    if overrides_string is not None:
+        (base / "overrides.json").write_text(overrides_string, encoding="utf-8")
     assert (
-        get_overrides(base, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
-        == EMPTY_RESOURCE_OVERRIDE
+        get_overrides(base, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None) == expected
     )
 
 
-def test_get_overrides_good_path(base):
-    overrides = empty_override()
-    overrides["CREATE"]["/foo/bar"] = {}
-
-    path = base / "overrides.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(overrides, f)
-    assert get_overrides(base, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None) == {
-        "CREATE": {("foo", "bar"): {}}
-    }
-
-
 def test_get_hook_overrides_no_root():
     assert (
         get_hook_overrides(None, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
@@ -510,51 +485,40 @@ def test_get_hook_overrides_no_root():
     )
 
 
-def test_get_hook_overrides_file_not_found(base):
-    path = base / "overrides.json"
-    try:
-        path.unlink()
-    except FileNotFoundError:
-        pass
-    assert (
-        get_hook_overrides(path, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
-        == EMPTY_HOOK_OVERRIDE
-    )
-
-
-def test_get_hook_overrides_invalid_file(base):
-    path = base / "overrides.json"
-    path.write_text("{}")
+@pytest.mark.parametrize(
+    "overrides_string,expected",
+    [
+        (None, EMPTY_HOOK_OVERRIDE),
+        ("{}", EMPTY_HOOK_OVERRIDE),
+        (
+            '{"CREATE_PRE_PROVISION": {"My::Example::Resource": '
+            '{"resourceProperties": {"/foo/bar": {}}}}}',
+            {
+                "CREATE_PRE_PROVISION": {
+                    "My::Example::Resource": {
+                        "resourceProperties": {("foo", "bar"): {}}
+                    }
+                }
+            },
+        ),
+    ],
+    ids=["file_not_found", "invalid_file", "good_path"],
+)
+def test_get_hook_overrides(base, overrides_string, expected):
+    if overrides_string is not None:
+        (base / "overrides.json").write_text(overrides_string, encoding="utf-8")
     assert (
         get_hook_overrides(base, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None)
-        == EMPTY_HOOK_OVERRIDE
+        == expected
     )
 
 
-def test_get_hook_overrides_good_path(base):
-    overrides = empty_hook_override()
-    overrides["CREATE_PRE_PROVISION"]["My::Example::Resource"] = {
-        "resourceProperties": {"/foo/bar": {}}
-    }
-
-    path = base / "overrides.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(overrides, f)
-    assert get_hook_overrides(
-        base, DEFAULT_REGION, "", None, DEFAULT_PROFILE, None
-    ) == {
-        "CREATE_PRE_PROVISION": {
-            "My::Example::Resource": {"resourceProperties": {("foo", "bar"): {}}}
-        }
-    }
-
-
 @pytest.mark.parametrize(
     "overrides_string,list_exports_return_value,expected_overrides",
     [
         (
             '{"CREATE": {"/foo/bar": "{{TestInvalidExport}}"}}',
-            [{"Exports": [{"Value": "TestValue", "Name": "Test"}]}],
+            TEST_EXPORT_PAGES,
             empty_override(),
         ),
         (
@@ -573,37 +537,51 @@ def test_get_hook_overrides_good_path(base):
         (
             '{"CREATE": {"/foo/bar": "{{TestExport}}",'
             + ' "/foo/bar2": "{{TestInvalidExport}}"}}',
-            [{"Exports": [{"Value": "TestValue", "Name": "TestExport"}]}],
+            TEST_EXPORT_PAGES,
             empty_override(),
         ),
     ],
+    ids=["invalid_export", "inline_export", "multi_page", "partial_invalid"],
 )
 def test_get_overrides_with_jinja(
-    base, overrides_string, list_exports_return_value, expected_overrides
+    base,
+    mock_paginator,
+    overrides_string,
+    list_exports_return_value,
+    expected_overrides,
 ):
-    mock_sts_client = Mock(spec=["get_session_token"])
-    mock_cfn_client = Mock(spec=["get_paginator"])
-    mock_paginator = Mock(spec=["paginate"])
-    mock_cfn_client.get_paginator.return_value = mock_paginator
     mock_paginator.paginate.return_value = list_exports_return_value
-    mock_sts_client.get_session_token.return_value = CREDENTIALS
-    patch_sdk = patch("rpdk.core.test.create_sdk_session", autospec=True)
 
-    path = base / "overrides.json"
-    with path.open("w", encoding="utf-8") as f:
-        f.write(overrides_string)
-    with patch_sdk as mock_sdk:
-        mock_sdk.return_value.region_name = "us-east-1"
-        mock_sdk.return_value.client.side_effect = [
-            mock_sts_client,
-            mock_cfn_client,
-            Mock(),
-        ]
-        result = get_overrides(base, DEFAULT_REGION, None, None, DEFAULT_PROFILE, None)
+    (base / "overrides.json").write_text(overrides_string, encoding="utf-8")
+    result = get_overrides(base, DEFAULT_REGION, None, None, DEFAULT_PROFILE, None)
 
     assert result == expected_overrides
 
 
+def test_get_cloudformation_exports_cached():
+    mock_cfn_client = Mock(spec=["get_paginator"])
+    mock_cfn_client.get_paginator.return_value.paginate.return_value = TEST_EXPORT_PAGES
+    headers = {"account_id": None, "source_arn": None}
+    patch_sdk = patch("rpdk.core.test.create_sdk_session", autospec=True)
+    patch_creds = patch(
+        "rpdk.core.test.get_temporary_credentials", autospec=True, return_value={}
+    )
+    with patch_sdk as mock_sdk, patch_creds as mock_creds:
+        mock_sdk.return_value.client.return_value = mock_cfn_client
+        first = get_cloudformation_exports(
+            DEFAULT_REGION, None, ROLE_ARN, DEFAULT_PROFILE, headers
+        )
+        second = get_cloudformation_exports(
+            DEFAULT_REGION, None, ROLE_ARN, DEFAULT_PROFILE, dict(headers)
+        )
+
+    assert first == second == {"TestExport": "TestValue"}
+    mock_sdk.assert_called_once_with(DEFAULT_REGION, DEFAULT_PROFILE)
+    mock_creds.assert_called_once_with(
+        mock_sdk.return_value, role_arn=ROLE_ARN, headers=headers
+    )
+
+
 @pytest.mark.parametrize(
     "schema,expected_marker_keywords",
     [
@@ -631,7 +609,7 @@ def test_get_marker_options(schema, expected_marker_keywords):
             '{"Name": "TestName"}',
             '{"Name": "TestNameNew"}',
             '{"Name": "TestNameNew"}',
-            [{"Exports": [{"Value": "TestValue", "Name": "Test"}]}],
+            TEST_EXPORT_PAGES,
             {
                 "CREATE": {"Name": "TestName"},
                 "UPDATE": {"Name": "TestNameNew"},
@@ -643,69 +621,40 @@ def test_get_marker_options(schema, expected_marker_keywords):
 # pylint: disable=R0913,R0914
 def test_with_inputs(
     base,
+    mock_paginator,
     create_string,
     update_string,
     invalid_string,
     list_exports_return_value,
     expected_inputs,
 ):
-    mock_sts_client = Mock(spec=["get_session_token"])
-    mock_sts_client.get_session_token.return_value = CREDENTIALS
-    mock_cfn_client = Mock(spec=["get_paginator"])
-    mock_paginator = Mock(spec=["paginate"])
-    mock_cfn_client.get_paginator.return_value = mock_paginator
     mock_paginator.paginate.return_value = list_exports_return_value
-    patch_sdk = patch("rpdk.core.test.create_sdk_session", autospec=True)
 
     create_input_file(base, create_string, update_string, invalid_string)
-    with patch_sdk as mock_sdk:
-        mock_sdk.return_value.region_name = "us-east-1"
-        mock_sdk.return_value.client.side_effect = [
-            mock_sts_client,
-            mock_cfn_client,
-            Mock(),
-        ]
-        result = get_inputs(base, DEFAULT_REGION, None, 1, None, DEFAULT_PROFILE, None)
+    result = get_inputs(base, DEFAULT_REGION, None, 1, None, DEFAULT_PROFILE, None)
 
     assert result == expected_inputs
 
 
-def test_with_inputs_invalid(base):
-    mock_sts_client = Mock(spec=["get_session_token"])
-    mock_sts_client.get_session_token.return_value = CREDENTIALS
-    mock_cfn_client = Mock(spec=["get_paginator"])
-    mock_paginator = Mock(spec=["paginate"])
-    mock_cfn_client.get_paginator.return_value = mock_paginator
-    mock_paginator.paginate.return_value = (
-        '[{"Exports": [{"Value": "TestValue", "Name": "Test"}]}]'
-    )
-    patch_sdk = patch("rpdk.core.test.create_sdk_session", autospec=True)
+def test_with_inputs_invalid(base, mock_paginator):
+    mock_paginator.paginate.return_value = TEST_EXPORT_PAGES
 
     create_invalid_input_file(base)
-    with patch_sdk as mock_sdk:
-        mock_sdk.return_value.region_name = "us-east-1"
-        mock_sdk.return_value.client.side_effect = [
-            mock_sts_client,
-            mock_cfn_client,
-            Mock(),
-        ]
-        result = get_inputs(base, DEFAULT_REGION, None, 1, None, DEFAULT_PROFILE, None)
+    result = get_inputs(base, DEFAULT_REGION, None, 1, None, DEFAULT_PROFILE, None)
 
     assert not result
 
 
-def test_get_input_invalid_root():
-    assert not get_inputs("", DEFAULT_REGION, "", 1, None, DEFAULT_PROFILE, None)
-
-
-def test_get_input_input_folder_does_not_exist(base):
-    assert not get_inputs(base, DEFAULT_REGION, "", 1, None, DEFAULT_PROFILE, None)
-
-
-def test_get_input_file_not_found(base):
-    path = base / "inputs"
-    os.mkdir(path, mode=0o777)
-    assert not get_inputs(base, DEFAULT_REGION, "", 1, None, DEFAULT_PROFILE, None)
+@pytest.mark.parametrize(
+    "has_root,has_inputs_dir",
+    [(False, False), (True, False), (True, True)],
+    ids=["invalid_root", "input_folder_does_not_exist", "file_not_found"],
+)
+def test_get_input_no_inputs(base, has_root, has_inputs_dir):
+    if has_inputs_dir:
+        (base / "inputs").mkdir()
+    root = base if has_root else ""
+    assert not get_inputs(root, DEFAULT_REGION, "", 1, None, DEFAULT_PROFILE, None)
 
 
 def test_use_both_sam_and_docker_arguments():